@@ -11,26 +11,42 @@ Based on analysis of comparable regulatory agencies:
 - California DTSC: ~1,000 staff, ~$196M budget
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 import json
+import sys
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib json module
+    orjson = None
 
-@dataclass
+
+SCENARIOS = ('minimal', 'moderate', 'comprehensive')
+
+# Benefits overhead on base salaries (health insurance, pension, payroll taxes)
+BENEFITS_OVERHEAD = 1.30
+
+
+@dataclass(frozen=True, slots=True)
 class StaffingCategory:
     """Represents a category of staff positions"""
     title: str
     count: int
     avg_salary: float
     description: str
+    # Fully-loaded cost per head and category total, fixed at construction
+    loaded_salary: float = field(init=False)
+    total_cost: float = field(init=False)
 
-    @property
-    def total_cost(self) -> float:
-        """Total personnel cost including benefits (30% overhead)"""
-        return self.count * self.avg_salary * 1.30
+    def __post_init__(self):
+        loaded_salary = self.avg_salary * BENEFITS_OVERHEAD
+        object.__setattr__(self, 'loaded_salary', loaded_salary)
+        object.__setattr__(self, 'total_cost', self.count * loaded_salary)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OperationalCost:
     """Represents an operational expense category"""
     category: str
@@ -38,27 +54,183 @@ class OperationalCost:
     description: str
 
 
+# Salary data based on NY state government compensation
+# Sources: NY OER salary schedules, SeeThroughNY data
+SALARY_RANGES = {
+    'executive_leadership': 175000,  # Commissioner, Deputy Commissioners
+    'senior_technical': 145000,      # Senior AI Safety Researchers, Principal Engineers
+    'technical_staff': 110000,       # AI Safety Researchers, ML Engineers, Evaluators
+    'policy_legal': 115000,          # Policy Analysts, Legal Counsel
+    'compliance_enforcement': 95000, # Compliance Officers, Enforcement Staff
+    'operations_admin': 70000,       # Administrative, HR, Finance, IT
+    'junior_technical': 85000,       # Junior Researchers, Analysts
+}
+
+
+# Staffing tables per scenario, built once at import time. Records are frozen,
+# so every model instance for a scenario shares the same tuple.
+
+# Small focused team - basic model evaluation and oversight
+_STAFFING_MINIMAL = (
+    StaffingCategory(
+        'Executive Leadership',
+        3,
+        SALARY_RANGES['executive_leadership'],
+        'Commissioner, Deputy Commissioner, Chief of Staff'
+    ),
+    StaffingCategory(
+        'Senior Technical Staff',
+        8,
+        SALARY_RANGES['senior_technical'],
+        'Senior AI Safety Researchers, Principal ML Engineers'
+    ),
+    StaffingCategory(
+        'Technical Staff',
+        20,
+        SALARY_RANGES['technical_staff'],
+        'AI Safety Researchers, ML Engineers, Model Evaluators'
+    ),
+    StaffingCategory(
+        'Policy & Legal',
+        8,
+        SALARY_RANGES['policy_legal'],
+        'Policy Analysts, Legal Counsel, Regulatory Affairs'
+    ),
+    StaffingCategory(
+        'Compliance & Enforcement',
+        6,
+        SALARY_RANGES['compliance_enforcement'],
+        'Compliance Officers, Enforcement Investigators'
+    ),
+    StaffingCategory(
+        'Operations & Administration',
+        5,
+        SALARY_RANGES['operations_admin'],
+        'Administrative Support, HR, Finance, IT'
+    ),
+)
+
+# Medium agency - comprehensive evaluation, compliance, enforcement
+_STAFFING_MODERATE = (
+    StaffingCategory(
+        'Executive Leadership',
+        5,
+        SALARY_RANGES['executive_leadership'],
+        'Commissioner, 2 Deputy Commissioners, Chief of Staff, Strategic Advisor'
+    ),
+    StaffingCategory(
+        'Senior Technical Staff',
+        20,
+        SALARY_RANGES['senior_technical'],
+        'Senior AI Safety Researchers, Principal Engineers, Technical Directors'
+    ),
+    StaffingCategory(
+        'Technical Staff',
+        60,
+        SALARY_RANGES['technical_staff'],
+        'AI Safety Researchers, ML Engineers, Model Evaluators, Security Analysts'
+    ),
+    StaffingCategory(
+        'Junior Technical Staff',
+        20,
+        SALARY_RANGES['junior_technical'],
+        'Junior Researchers, Technical Analysts, Research Associates'
+    ),
+    StaffingCategory(
+        'Policy & Legal',
+        20,
+        SALARY_RANGES['policy_legal'],
+        'Policy Analysts, Legal Counsel, Regulatory Affairs, Interagency Liaisons'
+    ),
+    StaffingCategory(
+        'Compliance & Enforcement',
+        15,
+        SALARY_RANGES['compliance_enforcement'],
+        'Compliance Officers, Enforcement Investigators, Audit Coordinators'
+    ),
+    StaffingCategory(
+        'Operations & Administration',
+        10,
+        SALARY_RANGES['operations_admin'],
+        'Administrative Support, HR, Finance, IT, Communications'
+    ),
+)
+
+# Large full-service agency - proactive monitoring, research, international coordination
+_STAFFING_COMPREHENSIVE = (
+    StaffingCategory(
+        'Executive Leadership',
+        8,
+        SALARY_RANGES['executive_leadership'],
+        'Commissioner, 3 Deputy Commissioners, Chief of Staff, Strategic Advisors, Division Directors'
+    ),
+    StaffingCategory(
+        'Senior Technical Staff',
+        40,
+        SALARY_RANGES['senior_technical'],
+        'Senior Researchers, Principal Engineers, Technical Directors, Research Leads'
+    ),
+    StaffingCategory(
+        'Technical Staff',
+        140,
+        SALARY_RANGES['technical_staff'],
+        'AI Safety Researchers, ML Engineers, Evaluators, Security Analysts, Red Team'
+    ),
+    StaffingCategory(
+        'Junior Technical Staff',
+        40,
+        SALARY_RANGES['junior_technical'],
+        'Junior Researchers, Technical Analysts, Research Associates'
+    ),
+    StaffingCategory(
+        'Policy & Legal',
+        35,
+        SALARY_RANGES['policy_legal'],
+        'Policy Analysts, Legal Counsel, Regulatory Affairs, International Coordinators'
+    ),
+    StaffingCategory(
+        'Compliance & Enforcement',
+        25,
+        SALARY_RANGES['compliance_enforcement'],
+        'Compliance Officers, Enforcement Investigators, Audit Team, Field Inspectors'
+    ),
+    StaffingCategory(
+        'Operations & Administration',
+        20,
+        SALARY_RANGES['operations_admin'],
+        'Administrative Support, HR, Finance, IT, Communications, Facilities'
+    ),
+)
+
+_STAFFING_BY_SCENARIO = {
+    'minimal': _STAFFING_MINIMAL,
+    'moderate': _STAFFING_MODERATE,
+    'comprehensive': _STAFFING_COMPREHENSIVE,
+}
+
+# Operational scale factors per scenario: (compute, facility, contract)
+_OPERATIONAL_SCALES = {
+    'minimal': (1.0, 0.8, 0.7),
+    'moderate': (2.0, 1.0, 1.0),
+    'comprehensive': (4.0, 1.2, 1.5),
+}
+
+
 class AIRegulatoryAgencyCostModel:
     """
     Cost model for a NY State Frontier AI Safety Regulatory Agency
 
+    The model is immutable after construction, so aggregate totals are
+    computed on first access and cached for the lifetime of the instance.
+
     The model covers three scenarios:
     1. Minimal: Small focused team (~50 staff)
     2. Moderate: Medium-sized agency (~150 staff)
     3. Comprehensive: Full-service regulatory body (~300 staff)
     """
 
-    # Salary data based on NY state government compensation
-    # Sources: NY OER salary schedules, SeeThroughNY data
-    SALARY_RANGES = {
-        'executive_leadership': 175000,  # Commissioner, Deputy Commissioners
-        'senior_technical': 145000,      # Senior AI Safety Researchers, Principal Engineers
-        'technical_staff': 110000,       # AI Safety Researchers, ML Engineers, Evaluators
-        'policy_legal': 115000,          # Policy Analysts, Legal Counsel
-        'compliance_enforcement': 95000, # Compliance Officers, Enforcement Staff
-        'operations_admin': 70000,       # Administrative, HR, Finance, IT
-        'junior_technical': 85000,       # Junior Researchers, Analysts
-    }
+    # Salary data, kept as a class attribute for backwards compatibility
+    SALARY_RANGES = SALARY_RANGES
 
     def __init__(self, scenario: str = 'moderate'):
         """
@@ -69,164 +241,25 @@ class AIRegulatoryAgencyCostModel:
         """
         self.scenario = scenario
         self.staffing = self._calculate_staffing()
+        # Column views of the records, so aggregates sum flat tuples
+        self._staff_counts = tuple(cat.count for cat in self.staffing)
+        self._staff_costs = tuple(cat.total_cost for cat in self.staffing)
         self.operational_costs = self._calculate_operational_costs()
+        self._operational_amounts = tuple(cost.annual_cost for cost in self.operational_costs)
+        self._summary_cache = None
 
-    def _calculate_staffing(self) -> List[StaffingCategory]:
-        """Calculate staffing needs based on scenario"""
-
-        if self.scenario == 'minimal':
-            # Small focused team - basic model evaluation and oversight
-            return [
-                StaffingCategory(
-                    'Executive Leadership',
-                    3,
-                    self.SALARY_RANGES['executive_leadership'],
-                    'Commissioner, Deputy Commissioner, Chief of Staff'
-                ),
-                StaffingCategory(
-                    'Senior Technical Staff',
-                    8,
-                    self.SALARY_RANGES['senior_technical'],
-                    'Senior AI Safety Researchers, Principal ML Engineers'
-                ),
-                StaffingCategory(
-                    'Technical Staff',
-                    20,
-                    self.SALARY_RANGES['technical_staff'],
-                    'AI Safety Researchers, ML Engineers, Model Evaluators'
-                ),
-                StaffingCategory(
-                    'Policy & Legal',
-                    8,
-                    self.SALARY_RANGES['policy_legal'],
-                    'Policy Analysts, Legal Counsel, Regulatory Affairs'
-                ),
-                StaffingCategory(
-                    'Compliance & Enforcement',
-                    6,
-                    self.SALARY_RANGES['compliance_enforcement'],
-                    'Compliance Officers, Enforcement Investigators'
-                ),
-                StaffingCategory(
-                    'Operations & Administration',
-                    5,
-                    self.SALARY_RANGES['operations_admin'],
-                    'Administrative Support, HR, Finance, IT'
-                ),
-            ]
-
-        elif self.scenario == 'moderate':
-            # Medium agency - comprehensive evaluation, compliance, enforcement
-            return [
-                StaffingCategory(
-                    'Executive Leadership',
-                    5,
-                    self.SALARY_RANGES['executive_leadership'],
-                    'Commissioner, 2 Deputy Commissioners, Chief of Staff, Strategic Advisor'
-                ),
-                StaffingCategory(
-                    'Senior Technical Staff',
-                    20,
-                    self.SALARY_RANGES['senior_technical'],
-                    'Senior AI Safety Researchers, Principal Engineers, Technical Directors'
-                ),
-                StaffingCategory(
-                    'Technical Staff',
-                    60,
-                    self.SALARY_RANGES['technical_staff'],
-                    'AI Safety Researchers, ML Engineers, Model Evaluators, Security Analysts'
-                ),
-                StaffingCategory(
-                    'Junior Technical Staff',
-                    20,
-                    self.SALARY_RANGES['junior_technical'],
-                    'Junior Researchers, Technical Analysts, Research Associates'
-                ),
-                StaffingCategory(
-                    'Policy & Legal',
-                    20,
-                    self.SALARY_RANGES['policy_legal'],
-                    'Policy Analysts, Legal Counsel, Regulatory Affairs, Interagency Liaisons'
-                ),
-                StaffingCategory(
-                    'Compliance & Enforcement',
-                    15,
-                    self.SALARY_RANGES['compliance_enforcement'],
-                    'Compliance Officers, Enforcement Investigators, Audit Coordinators'
-                ),
-                StaffingCategory(
-                    'Operations & Administration',
-                    10,
-                    self.SALARY_RANGES['operations_admin'],
-                    'Administrative Support, HR, Finance, IT, Communications'
-                ),
-            ]
-
-        else:  # comprehensive
-            # Large full-service agency - proactive monitoring, research, international coordination
-            return [
-                StaffingCategory(
-                    'Executive Leadership',
-                    8,
-                    self.SALARY_RANGES['executive_leadership'],
-                    'Commissioner, 3 Deputy Commissioners, Chief of Staff, Strategic Advisors, Division Directors'
-                ),
-                StaffingCategory(
-                    'Senior Technical Staff',
-                    40,
-                    self.SALARY_RANGES['senior_technical'],
-                    'Senior Researchers, Principal Engineers, Technical Directors, Research Leads'
-                ),
-                StaffingCategory(
-                    'Technical Staff',
-                    140,
-                    self.SALARY_RANGES['technical_staff'],
-                    'AI Safety Researchers, ML Engineers, Evaluators, Security Analysts, Red Team'
-                ),
-                StaffingCategory(
-                    'Junior Technical Staff',
-                    40,
-                    self.SALARY_RANGES['junior_technical'],
-                    'Junior Researchers, Technical Analysts, Research Associates'
-                ),
-                StaffingCategory(
-                    'Policy & Legal',
-                    35,
-                    self.SALARY_RANGES['policy_legal'],
-                    'Policy Analysts, Legal Counsel, Regulatory Affairs, International Coordinators'
-                ),
-                StaffingCategory(
-                    'Compliance & Enforcement',
-                    25,
-                    self.SALARY_RANGES['compliance_enforcement'],
-                    'Compliance Officers, Enforcement Investigators, Audit Team, Field Inspectors'
-                ),
-                StaffingCategory(
-                    'Operations & Administration',
-                    20,
-                    self.SALARY_RANGES['operations_admin'],
-                    'Administrative Support, HR, Finance, IT, Communications, Facilities'
-                ),
-            ]
+    def _calculate_staffing(self) -> Tuple[StaffingCategory, ...]:
+        """Look up staffing needs based on scenario"""
+        return _STAFFING_BY_SCENARIO.get(self.scenario, _STAFFING_COMPREHENSIVE)
 
     def _calculate_operational_costs(self) -> List[OperationalCost]:
         """Calculate operational costs based on scenario and staffing"""
 
-        total_staff = sum(cat.count for cat in self.staffing)
-
-        # Scale factors for different scenarios
-        if self.scenario == 'minimal':
-            compute_scale = 1.0
-            facility_scale = 0.8
-            contract_scale = 0.7
-        elif self.scenario == 'moderate':
-            compute_scale = 2.0
-            facility_scale = 1.0
-            contract_scale = 1.0
-        else:  # comprehensive
-            compute_scale = 4.0
-            facility_scale = 1.2
-            contract_scale = 1.5
+        total_staff = self.total_staff_count
+
+        compute_scale, facility_scale, contract_scale = _OPERATIONAL_SCALES.get(
+            self.scenario, _OPERATIONAL_SCALES['comprehensive']
+        )
 
         return [
             OperationalCost(
@@ -281,34 +314,41 @@ class AIRegulatoryAgencyCostModel:
             ),
         ]
 
-    @property
+    @cached_property
     def total_personnel_cost(self) -> float:
         """Total personnel costs including benefits"""
-        return sum(cat.total_cost for cat in self.staffing)
+        return sum(self._staff_costs)
 
-    @property
+    @cached_property
     def total_operational_cost(self) -> float:
         """Total operational costs"""
-        return sum(cost.annual_cost for cost in self.operational_costs)
+        return sum(self._operational_amounts)
 
-    @property
+    @cached_property
     def total_annual_cost(self) -> float:
         """Total annual budget requirement"""
         return self.total_personnel_cost + self.total_operational_cost
 
-    @property
+    @cached_property
     def total_staff_count(self) -> int:
         """Total number of staff"""
-        return sum(cat.count for cat in self.staffing)
+        return sum(self._staff_counts)
 
-    @property
+    @cached_property
     def cost_per_employee(self) -> float:
         """Average cost per employee (fully loaded)"""
         return self.total_annual_cost / self.total_staff_count
 
     def generate_summary(self) -> Dict:
-        """Generate a comprehensive summary of the cost model"""
-        return {
+        """
+        Generate a comprehensive summary of the cost model
+
+        The summary is built on first call and the same dict is returned on
+        later calls; treat it as read-only.
+        """
+        if self._summary_cache is not None:
+            return self._summary_cache
+        self._summary_cache = {
             'scenario': self.scenario.title(),
             'total_staff': self.total_staff_count,
             'total_annual_budget': self.total_annual_cost,
@@ -334,76 +374,95 @@ class AIRegulatoryAgencyCostModel:
                 for cost in self.operational_costs
             ]
         }
+        return self._summary_cache
 
     def print_summary(self):
         """Print a formatted summary to console"""
-        print(f"\n{'='*80}")
-        print(f"NY FRONTIER AI SAFETY AGENCY - {self.scenario.upper()} SCENARIO")
-        print(f"{'='*80}\n")
-
-        print(f"TOTAL ANNUAL BUDGET: ${self.total_annual_cost:,.0f}")
-        print(f"Total Staff: {self.total_staff_count}")
-        print(f"Cost per Employee (fully loaded): ${self.cost_per_employee:,.0f}")
-        print()
-
-        print(f"PERSONNEL COSTS: ${self.total_personnel_cost:,.0f} ({self.total_personnel_cost/self.total_annual_cost*100:.1f}%)")
-        print(f"{'-'*80}")
+        total = self.total_annual_cost
+        pct_scale = 100.0 / total
+        parts = [
+            f"\n{'='*80}",
+            f"NY FRONTIER AI SAFETY AGENCY - {self.scenario.upper()} SCENARIO",
+            f"{'='*80}\n",
+            f"TOTAL ANNUAL BUDGET: ${total:,.0f}",
+            f"Total Staff: {self.total_staff_count}",
+            f"Cost per Employee (fully loaded): ${self.cost_per_employee:,.0f}",
+            "",
+            f"PERSONNEL COSTS: ${self.total_personnel_cost:,.0f} ({self.total_personnel_cost*pct_scale:.1f}%)",
+            f"{'-'*80}",
+        ]
         for cat in self.staffing:
-            pct = cat.total_cost / self.total_annual_cost * 100
-            print(f"  {cat.title:40} {cat.count:3} staff  ${cat.total_cost:>12,.0f}  ({pct:4.1f}%)")
-        print()
+            parts.append(f"  {cat.title:40} {cat.count:3} staff  ${cat.total_cost:>12,.0f}  ({cat.total_cost*pct_scale:4.1f}%)")
+        parts.append("")
 
-        print(f"OPERATIONAL COSTS: ${self.total_operational_cost:,.0f} ({self.total_operational_cost/self.total_annual_cost*100:.1f}%)")
-        print(f"{'-'*80}")
+        parts.append(f"OPERATIONAL COSTS: ${self.total_operational_cost:,.0f} ({self.total_operational_cost*pct_scale:.1f}%)")
+        parts.append(f"{'-'*80}")
         for cost in self.operational_costs:
-            pct = cost.annual_cost / self.total_annual_cost * 100
-            print(f"  {cost.category:40} ${cost.annual_cost:>12,.0f}  ({pct:4.1f}%)")
-        print(f"\n{'='*80}\n")
+            parts.append(f"  {cost.category:40} ${cost.annual_cost:>12,.0f}  ({cost.annual_cost*pct_scale:4.1f}%)")
+        parts.append(f"\n{'='*80}\n")
+
+        sys.stdout.write('\n'.join(parts) + '\n')
 
 
-def compare_scenarios():
+def build_models() -> Dict[str, AIRegulatoryAgencyCostModel]:
+    """Build one cost model per scenario"""
+    return {s: AIRegulatoryAgencyCostModel(s) for s in SCENARIOS}
+
+
+def compare_scenarios(models: Optional[Dict[str, AIRegulatoryAgencyCostModel]] = None):
     """Compare all three scenarios side by side"""
-    scenarios = ['minimal', 'moderate', 'comprehensive']
-    models = {s: AIRegulatoryAgencyCostModel(s) for s in scenarios}
-
-    print(f"\n{'='*80}")
-    print("SCENARIO COMPARISON")
-    print(f"{'='*80}\n")
-
-    print(f"{'Metric':<30} {'Minimal':>15} {'Moderate':>15} {'Comprehensive':>15}")
-    print(f"{'-'*80}")
-    print(f"{'Total Staff':<30} {models['minimal'].total_staff_count:>15,} {models['moderate'].total_staff_count:>15,} {models['comprehensive'].total_staff_count:>15,}")
-    print(f"{'Annual Budget':<30} ${models['minimal'].total_annual_cost:>14,.0f} ${models['moderate'].total_annual_cost:>14,.0f} ${models['comprehensive'].total_annual_cost:>14,.0f}")
-    print(f"{'Personnel Costs':<30} ${models['minimal'].total_personnel_cost:>14,.0f} ${models['moderate'].total_personnel_cost:>14,.0f} ${models['comprehensive'].total_personnel_cost:>14,.0f}")
-    print(f"{'Operational Costs':<30} ${models['minimal'].total_operational_cost:>14,.0f} ${models['moderate'].total_operational_cost:>14,.0f} ${models['comprehensive'].total_operational_cost:>14,.0f}")
-    print(f"{'Cost per Employee':<30} ${models['minimal'].cost_per_employee:>14,.0f} ${models['moderate'].cost_per_employee:>14,.0f} ${models['comprehensive'].cost_per_employee:>14,.0f}")
-    print(f"\n{'='*80}\n")
+    if models is None:
+        models = build_models()
+
+    minimal, moderate, comprehensive = (models[s] for s in SCENARIOS)
+    parts = [
+        f"\n{'='*80}",
+        "SCENARIO COMPARISON",
+        f"{'='*80}\n",
+        f"{'Metric':<30} {'Minimal':>15} {'Moderate':>15} {'Comprehensive':>15}",
+        f"{'-'*80}",
+        f"{'Total Staff':<30} {minimal.total_staff_count:>15,} {moderate.total_staff_count:>15,} {comprehensive.total_staff_count:>15,}",
+        f"{'Annual Budget':<30} ${minimal.total_annual_cost:>14,.0f} ${moderate.total_annual_cost:>14,.0f} ${comprehensive.total_annual_cost:>14,.0f}",
+        f"{'Personnel Costs':<30} ${minimal.total_personnel_cost:>14,.0f} ${moderate.total_personnel_cost:>14,.0f} ${comprehensive.total_personnel_cost:>14,.0f}",
+        f"{'Operational Costs':<30} ${minimal.total_operational_cost:>14,.0f} ${moderate.total_operational_cost:>14,.0f} ${comprehensive.total_operational_cost:>14,.0f}",
+        f"{'Cost per Employee':<30} ${minimal.cost_per_employee:>14,.0f} ${moderate.cost_per_employee:>14,.0f} ${comprehensive.cost_per_employee:>14,.0f}",
+        f"\n{'='*80}\n",
+    ]
+    sys.stdout.write('\n'.join(parts) + '\n')
 
     return models
 
 
-def export_to_json(filename: str = 'cost_analysis.json'):
+def export_to_json(filename: str = 'cost_analysis.json',
+                   models: Optional[Dict[str, AIRegulatoryAgencyCostModel]] = None):
     """Export all scenarios to JSON for web interface"""
-    scenarios = ['minimal', 'moderate', 'comprehensive']
+    if models is None:
+        models = build_models()
     data = {
-        scenario: AIRegulatoryAgencyCostModel(scenario).generate_summary()
-        for scenario in scenarios
+        scenario: models[scenario].generate_summary()
+        for scenario in SCENARIOS
     }
 
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=2)
 
     print(f"Cost analysis exported to {filename}")
 
 
 if __name__ == '__main__':
+    # Build each scenario once and share it across all reports
+    models = build_models()
+
     # Print all scenarios
-    for scenario in ['minimal', 'moderate', 'comprehensive']:
-        model = AIRegulatoryAgencyCostModel(scenario)
+    for model in models.values():
         model.print_summary()
 
     # Compare scenarios
-    compare_scenarios()
+    compare_scenarios(models)
 
     # Export to JSON
-    export_to_json()
+    export_to_json(models=models)